@@ -4,18 +4,20 @@ This module provides functions for Claude Code skills to interact with
 the Shokz Transfer Utility library programmatically.
 """
 
+import heapq
 from collections import Counter
 from dataclasses import dataclass
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Optional
 
 from .config import load_config, Config
 from .indexer import Track, load_cache, cache_exists
 from .playlist import Playlist, save_session, load_session, session_exists
-from .search import SearchField, search_tracks
+from .search import SearchField, batch_search, search_tracks
 
 
-@dataclass
+@dataclass(slots=True)
 class LibrarySummary:
     """Summary statistics about the music library."""
     total_tracks: int
@@ -28,6 +30,65 @@ class LibrarySummary:
     format_breakdown: dict[str, int]    # {"mp3": count, "aac": count}
 
 
+@dataclass(slots=True)
+class LibraryIndex:
+    """Tracks grouped by lowercase artist, album and genre for exact-match lookups."""
+    by_artist: dict[str, list[Track]]
+    by_album: dict[str, list[Track]]
+    by_genre: dict[str, list[Track]]
+
+
+# Genre values treated as missing metadata by get_tracks_with_unknown_genre
+UNKNOWN_GENRES = frozenset({"", "unknown", "other", "misc", "none"})
+
+# Most recently built index: (library list, track count, index)
+_library_index: Optional[tuple[list[Track], int, LibraryIndex]] = None
+
+
+def build_library_index(library: list[Track]) -> LibraryIndex:
+    """Group tracks by artist, album and genre in a single pass.
+
+    Args:
+        library: The track library.
+
+    Returns:
+        LibraryIndex keyed by the lowercase field values.
+    """
+    by_artist: dict[str, list[Track]] = {}
+    by_album: dict[str, list[Track]] = {}
+    by_genre: dict[str, list[Track]] = {}
+
+    for track in library:
+        by_artist.setdefault(track.artist_lower, []).append(track)
+        by_album.setdefault(track.album_lower, []).append(track)
+        by_genre.setdefault(track.genre_lower, []).append(track)
+
+    return LibraryIndex(by_artist=by_artist, by_album=by_album, by_genre=by_genre)
+
+
+def get_library_index(library: list[Track]) -> LibraryIndex:
+    """Get the index for a library, reusing it while the same list is passed in.
+
+    The index is rebuilt when a different list is given or its length changes.
+
+    Args:
+        library: The track library.
+
+    Returns:
+        LibraryIndex for the library.
+    """
+    global _library_index
+
+    if _library_index is not None:
+        indexed_library, indexed_count, index = _library_index
+        if indexed_library is library and indexed_count == len(library):
+            return index
+
+    index = build_library_index(library)
+    _library_index = (library, len(library), index)
+    return index
+
+
 def get_library() -> Optional[list[Track]]:
     """Load the music library from cache.
 
@@ -53,14 +114,22 @@ def get_library_summary(library: Optional[list[Track]] = None) -> Optional[Libra
     if library is None:
         return None
 
-    # Count artists, albums, genres
-    artists = Counter(t.artist for t in library)
-    albums = set(t.album for t in library)
-    genres = Counter(t.genre for t in library)
-    formats = Counter(t.format for t in library)
+    # Count artists, albums, genres and formats in a single pass
+    artists: Counter[str] = Counter()
+    albums: set[str] = set()
+    genres: Counter[str] = Counter()
+    formats: Counter[str] = Counter()
+    total_bytes = 0
+
+    for t in library:
+        artists[t.artist] += 1
+        albums.add(t.album)
+        genres[t.genre] += 1
+        formats[t.format] += 1
+        total_bytes += t.size_bytes
 
     # Calculate totals
-    total_size = sum(t.size_bytes for t in library) / (1024 * 1024)
+    total_size = total_bytes / (1024 * 1024)
 
     return LibrarySummary(
         total_tracks=len(library),
@@ -68,8 +137,8 @@ def get_library_summary(library: Optional[list[Track]] = None) -> Optional[Libra
         unique_artists=len(artists),
         unique_albums=len(albums),
         unique_genres=len(genres),
-        top_artists=artists.most_common(20),
-        top_genres=genres.most_common(15),
+        top_artists=heapq.nlargest(20, artists.items(), key=itemgetter(1)),
+        top_genres=heapq.nlargest(15, genres.items(), key=itemgetter(1)),
         format_breakdown=dict(formats),
     )
 
@@ -126,6 +195,25 @@ def search_by_genre(library: list[Track], query: str) -> list[Track]:
     return search_tracks(library, query, SearchField.GENRE)
 
 
+def search_many(
+    library: list[Track],
+    queries: dict[SearchField, list[str]],
+) -> dict[SearchField, dict[str, list[Track]]]:
+    """Run several searches in one pass over the library.
+
+    Faster than calling the search_by_* helpers repeatedly when exploring
+    many artists, genres or titles at once.
+
+    Args:
+        library: The track library to search.
+        queries: Queries per field, e.g. {SearchField.ARTIST: ["beatles", "queen"]}.
+
+    Returns:
+        Dict mapping each field to a dict of query -> matching tracks.
+    """
+    return batch_search(library, queries)
+
+
 def format_track_list(tracks: list[Track], show_index: bool = True) -> str:
     """Format a list of tracks as a readable string.
 
@@ -163,8 +251,8 @@ def get_all_by_artist(library: list[Track], artist: str) -> list[Track]:
     Returns:
         List of tracks sorted by album, then title.
     """
-    tracks = [t for t in library if t.artist.lower() == artist.lower()]
-    return sorted(tracks, key=lambda t: (t.album.lower(), t.title.lower()))
+    tracks = get_library_index(library).by_artist.get(artist.lower(), [])
+    return sorted(tracks, key=attrgetter("album_lower", "title_lower"))
 
 
 def get_all_from_album(library: list[Track], album: str) -> list[Track]:
@@ -177,8 +265,8 @@ def get_all_from_album(library: list[Track], album: str) -> list[Track]:
     Returns:
         List of tracks sorted by title.
     """
-    tracks = [t for t in library if t.album.lower() == album.lower()]
-    return sorted(tracks, key=lambda t: t.title.lower())
+    tracks = get_library_index(library).by_album.get(album.lower(), [])
+    return sorted(tracks, key=attrgetter("title_lower"))
 
 
 def get_all_in_genre(library: list[Track], genre: str) -> list[Track]:
@@ -191,8 +279,8 @@ def get_all_in_genre(library: list[Track], genre: str) -> list[Track]:
     Returns:
         List of tracks sorted by artist, then title.
     """
-    tracks = [t for t in library if t.genre.lower() == genre.lower()]
-    return sorted(tracks, key=lambda t: (t.artist.lower(), t.title.lower()))
+    tracks = get_library_index(library).by_genre.get(genre.lower(), [])
+    return sorted(tracks, key=attrgetter("artist_lower", "title_lower"))
 
 
 def create_playlist(tracks: list[Track], capacity_mb: int = 4000) -> Playlist:
@@ -293,8 +381,7 @@ def get_tracks_with_unknown_genre(library: list[Track]) -> list[Track]:
     Returns:
         Tracks with empty or "Unknown" genre fields.
     """
-    unknown_values = {"", "unknown", "other", "misc", "none"}
-    return [t for t in library if t.genre.lower().strip() in unknown_values]
+    return [t for t in library if t.genre_lower.strip() in UNKNOWN_GENRES]
 
 
 def get_tracks_by_artist_for_inference(library: list[Track], artists: list[str]) -> dict[str, list[Track]]:
@@ -312,9 +399,9 @@ def get_tracks_by_artist_for_inference(library: list[Track], artists: list[str])
         Dict mapping artist names to their tracks.
     """
     result = {}
-    artist_set = {a.lower() for a in artists}
-    for track in library:
-        if track.artist.lower() in artist_set:
+    by_artist = get_library_index(library).by_artist
+    for artist_lower in dict.fromkeys(a.lower() for a in artists):
+        for track in by_artist.get(artist_lower, []):
             if track.artist not in result:
                 result[track.artist] = []
             result[track.artist].append(track)
@@ -8,8 +8,11 @@ from typing import Optional
 # Default config file location (project root)
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "config.json"
 
+# Parsed configs by path, with the file mtime they were read at
+_config_cache: dict[Path, tuple[int, "Config"]] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class Config:
     """Application configuration."""
 
@@ -19,6 +22,15 @@ class Config:
     capacity_mb: int
     format_preference: str  # "aac" or "mp3"
     music_extensions: list[str] = field(default_factory=lambda: [".mp3", ".m4a", ".aac"])
+    metadata_executor: str = "process"  # "process" or "thread" (thread suits slow network mounts)
+    scan_workers: int = 8  # Threads listing directories during a scan (1 = sequential walk)
+    copy_workers: int = 4  # Files copied to the Shokz at once (1 = one at a time)
+
+    # Lowercase music_extensions as a set, for per-file membership checks
+    music_extensions_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.music_extensions_set = frozenset(ext.lower() for ext in self.music_extensions)
 
     @property
     def source_paths(self) -> list[Path]:
@@ -32,21 +44,34 @@ class Config:
 
 
 def load_config(config_path: Optional[Path] = None) -> Config:
-    """Load configuration from JSON file."""
+    """Load configuration from JSON file.
+
+    The parsed Config is reused until the file's modification time changes.
+    """
     path = config_path or DEFAULT_CONFIG_PATH
 
-    with open(path, "r") as f:
-        data = json.load(f)
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _config_cache.get(path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
 
-    return Config(
+    data = json.loads(path.read_bytes())
+
+    config = Config(
         primary_source=Path(data["sources"]["primary"]),
         secondary_source=Path(data["sources"]["secondary"]),
         target=Path(data["target"]),
         capacity_mb=data["capacity_mb"],
         format_preference=data["format_preference"],
         music_extensions=data.get("music_extensions", [".mp3", ".m4a", ".aac"]),
+        metadata_executor=data.get("metadata_executor", "process"),
+        scan_workers=data.get("scan_workers", 8),
+        copy_workers=data.get("copy_workers", 4),
     )
 
+    _config_cache[path] = (mtime_ns, config)
+    return config
+
 
 def save_config(config: Config, config_path: Optional[Path] = None) -> None:
     """Save configuration to JSON file."""
@@ -61,8 +86,13 @@ def save_config(config: Config, config_path: Optional[Path] = None) -> None:
         "capacity_mb": config.capacity_mb,
         "format_preference": config.format_preference,
         "music_extensions": config.music_extensions,
+        "metadata_executor": config.metadata_executor,
+        "scan_workers": config.scan_workers,
+        "copy_workers": config.copy_workers,
     }
 
     with open(path, "w") as f:
         json.dump(data, f, indent=2)
         f.write("\n")
+
+    _config_cache.pop(path, None)
@@ -1,18 +1,22 @@
 """Library scanning and indexing for music files."""
 
 import json
-from dataclasses import dataclass, asdict
+import os
+import struct
+import sys
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable
-import mutagen
-from mutagen.easyid3 import EasyID3
+from typing import Callable, Collection, Optional
+from mutagen import MutagenError
+from mutagen.mp3 import EasyMP3
 from mutagen.mp4 import MP4
 
 from .config import Config
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     """Represents a music track with its metadata."""
 
@@ -23,6 +27,20 @@ class Track:
     genre: str
     size_bytes: int
     format: str  # "mp3" or "aac"
+    mtime_ns: int = 0  # File modification time when the metadata was read
+
+    # Lowercase copies of the text fields, computed once for case-insensitive matching
+    title_lower: str = field(init=False, repr=False, compare=False)
+    artist_lower: str = field(init=False, repr=False, compare=False)
+    album_lower: str = field(init=False, repr=False, compare=False)
+    genre_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.title_lower = self.title.lower()
+        self.artist_lower = self.artist.lower()
+        self.album_lower = self.album.lower()
+        self.genre_lower = self.genre.lower()
+        _share_strings(self)
 
     @property
     def size_mb(self) -> float:
@@ -30,25 +48,69 @@ class Track:
         return self.size_bytes / (1024 * 1024)
 
     @property
-    def dedupe_key(self) -> str:
+    def dedupe_key(self) -> tuple[str, str]:
         """Key used for deduplication (lowercase title + artist)."""
-        return f"{self.title.lower()}|{self.artist.lower()}"
+        return (self.title_lower, self.artist_lower)
+
+
+# One shared object per distinct artist/album/genre value seen, so a library
+# holds each repeated tag string once (grows with distinct values, not tracks)
+_shared_strings: dict[str, str] = {}
 
 
-def extract_metadata(file_path: Path) -> Optional[Track]:
+def _share_strings(track: Track) -> Track:
+    """Point a track's artist, album and genre strings at their shared copies.
+
+    The lowercase forms are shared too. Returns the same track.
+    """
+    share = _shared_strings.setdefault
+    track.artist = share(track.artist, track.artist)
+    track.album = share(track.album, track.album)
+    track.genre = share(track.genre, track.genre)
+    track.artist_lower = share(track.artist_lower, track.artist_lower)
+    track.album_lower = share(track.album_lower, track.album_lower)
+    track.genre_lower = share(track.genre_lower, track.genre_lower)
+    return track
+
+
+def reset_shared_strings() -> None:
+    """Forget the shared tag strings, e.g. before (re)loading a library.
+
+    Tracks already built keep their strings; only later ones stop sharing
+    with them, so the table doesn't outlive the library it was built for.
+    """
+    _shared_strings.clear()
+
+
+def extract_metadata(
+    file_path: Path,
+    size_bytes: Optional[int] = None,
+    mtime_ns: Optional[int] = None,
+) -> Optional[Track]:
     """Extract metadata from a music file using mutagen.
 
+    Args:
+        file_path: Path to the music file.
+        size_bytes: File size if already known from the directory scan.
+        mtime_ns: File modification time if already known from the directory scan.
+
     Returns None if the file can't be read or has no usable metadata.
     """
     try:
-        size_bytes = file_path.stat().st_size
+        if size_bytes is None or mtime_ns is None:
+            stat = file_path.stat()
+            size_bytes = stat.st_size
+            mtime_ns = stat.st_mtime_ns
         suffix = file_path.suffix.lower()
 
         # Determine format
         if suffix == ".mp3":
             audio_format = "mp3"
-            audio = mutagen.File(file_path, easy=True)
-            if audio is None:
+            # Open directly as MP3 - the suffix already tells us the format,
+            # so skip mutagen's format autodetection
+            try:
+                audio = EasyMP3(file_path)
+            except MutagenError:
                 return None
 
             title = _get_tag(audio, "title", file_path.stem)
@@ -76,6 +138,7 @@ def extract_metadata(file_path: Path) -> Optional[Track]:
             genre=genre,
             size_bytes=size_bytes,
             format=audio_format,
+            mtime_ns=mtime_ns,
         )
 
     except Exception:
@@ -99,21 +162,21 @@ def _get_mp4_tag(audio: MP4, tag_name: str, default: str) -> str:
     return default
 
 
+@dataclass(slots=True)
 class ScanError:
     """Represents an error encountered while scanning a directory."""
 
-    def __init__(self, path: Path, error_type: str, message: str):
-        self.path = path
-        self.error_type = error_type  # "not_found" or "permission_denied"
-        self.message = message
+    path: Path
+    error_type: str  # "not_found" or "permission_denied"
+    message: str
 
 
+@dataclass(slots=True)
 class ScanResult:
     """Result of scanning a directory."""
 
-    def __init__(self, files: list[Path], error: Optional[ScanError] = None):
-        self.files = files
-        self.error = error
+    files: list[tuple[Path, int, int]]  # (path, size_bytes, mtime_ns)
+    error: Optional[ScanError] = None
 
     @property
     def success(self) -> bool:
@@ -125,8 +188,6 @@ def check_directory_access(directory: Path) -> Optional[ScanError]:
 
     Returns None if accessible, or a ScanError describing the problem.
     """
-    import os
-
     # First check if parent path is accessible (helps detect mount issues)
     try:
         # Try to access the path
@@ -182,10 +243,89 @@ def check_directory_access(directory: Path) -> Optional[ScanError]:
         )
 
 
+def _scan_entries(
+    directory: str,
+    extensions_lower: tuple[str, ...],
+) -> tuple[list[tuple[Path, int, int]], list[str]]:
+    """List one directory's music files and subdirectories.
+
+    Uses os.scandir so file type checks and sizes come from the cached
+    directory entry. Raises OSError (e.g. PermissionError) if the directory
+    itself can't be read; entries that can't be read are skipped.
+
+    Returns:
+        Tuple of (path, size_bytes, mtime_ns) file entries and subdirectory paths.
+    """
+    files: list[tuple[Path, int, int]] = []
+    subdirs: list[str] = []
+
+    # Bind the per-entry methods once, outside the loop
+    files_append = files.append
+    subdirs_append = subdirs.append
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs_append(entry.path)
+                elif entry.name.lower().endswith(extensions_lower) and entry.is_file():
+                    stat = entry.stat()
+                    files_append((Path(entry.path), stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                # Skip files we can't access, or that were deleted after
+                # the directory was read (entry.stat() is a fresh syscall)
+                continue
+
+    return files, subdirs
+
+
+def _walk_parallel(
+    subdirs: list[str],
+    extensions_lower: tuple[str, ...],
+    workers: int,
+    progress_callback: Optional[Callable[[Path], None]] = None,
+) -> list[tuple[Path, int, int]]:
+    """Scan a set of directory trees with a pool of threads.
+
+    Each directory listing is handed to the pool as soon as its parent has
+    been read, so round-trips to a network mount overlap. Listings are then
+    stitched together in the same order a sequential walk would produce.
+    The progress callback only ever runs on the calling thread.
+    """
+    listings: dict[str, tuple[list[tuple[Path, int, int]], list[str]]] = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(_scan_entries, d, extensions_lower): d for d in subdirs}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                current = pending.pop(future)
+                try:
+                    listing = future.result()
+                except OSError:
+                    # Skip subdirectories we can't access or that vanished mid-scan
+                    listing = ([], [])
+                listings[current] = listing
+                if progress_callback:
+                    for file_path, _, _ in listing[0]:
+                        progress_callback(file_path)
+                for subdir in listing[1]:
+                    pending[executor.submit(_scan_entries, subdir, extensions_lower)] = subdir
+
+    files: list[tuple[Path, int, int]] = []
+    stack = list(subdirs)
+    while stack:
+        dir_files, dir_subdirs = listings[stack.pop()]
+        files.extend(dir_files)
+        stack.extend(dir_subdirs)
+    return files
+
+
 def scan_directory(
     directory: Path,
     extensions: list[str],
     progress_callback: Optional[Callable[[Path], None]] = None,
+    workers: int = 1,
 ) -> ScanResult:
     """Recursively scan a directory for music files.
 
@@ -193,32 +333,24 @@ def scan_directory(
         directory: Root directory to scan.
         extensions: List of file extensions to include (e.g., [".mp3", ".m4a"]).
         progress_callback: Optional callback called for each file found.
+        workers: Number of threads listing directories concurrently. Values
+            above 1 help on network mounts where each listing waits on the server.
 
     Returns:
-        ScanResult with list of paths and any error encountered.
+        ScanResult with (path, size_bytes, mtime_ns) entries and any error encountered.
     """
     # Check directory access first
     error = check_directory_access(directory)
     if error:
         return ScanResult([], error)
 
-    files = []
-    extensions_lower = [ext.lower() for ext in extensions]
+    extensions_lower = tuple(ext.lower() for ext in extensions)
 
     try:
-        for file_path in directory.rglob("*"):
-            try:
-                if file_path.is_file() and file_path.suffix.lower() in extensions_lower:
-                    files.append(file_path)
-                    if progress_callback:
-                        progress_callback(file_path)
-            except PermissionError:
-                # Skip files we can't access
-                continue
-
+        files, subdirs = _scan_entries(str(directory), extensions_lower)
     except PermissionError:
         return ScanResult(
-            files,
+            [],
             ScanError(
                 directory,
                 "permission_denied",
@@ -226,15 +358,107 @@ def scan_directory(
             ),
         )
 
+    if progress_callback:
+        for file_path, _, _ in files:
+            progress_callback(file_path)
+
+    if workers > 1:
+        files.extend(_walk_parallel(subdirs, extensions_lower, workers, progress_callback))
+        return ScanResult(files)
+
+    pending = subdirs
+    while pending:
+        try:
+            dir_files, dir_subdirs = _scan_entries(pending.pop(), extensions_lower)
+        except OSError:
+            # Skip subdirectories we can't access or that vanished mid-scan
+            continue
+        files.extend(dir_files)
+        pending.extend(dir_subdirs)
+        if progress_callback:
+            for file_path, _, _ in dir_files:
+                progress_callback(file_path)
+
     return ScanResult(files)
 
 
+# Number of files handed to each worker at a time during metadata extraction
+METADATA_CHUNKSIZE = 64
+
+# How many files ahead of the one being parsed to ask the OS to read in advance
+PREFETCH_DEPTH = 4
+
+# Bytes to read ahead from the start of each file (where the tags live)
+PREFETCH_BYTES = 256 * 1024
+
+# macOS fcntl command for read-ahead advice (not exposed by the fcntl module)
+_F_RDADVISE = 44
+
+
+def _prefetch_file(file_path: Path, size_bytes: int) -> None:
+    """Hint the OS to start reading the beginning of a file into its page cache.
+
+    The hint is asynchronous, so the caller can keep parsing the current file
+    while the disk (or NAS) fetches the next one. Failures are ignored.
+    """
+    length = min(size_bytes, PREFETCH_BYTES)
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+        elif sys.platform == "darwin":
+            import fcntl
+            # struct radvisory { off_t ra_offset; int ra_count; } (packed)
+            fcntl.fcntl(fd, _F_RDADVISE, struct.pack("=qi", 0, length))
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _extract_metadata_batch(batch: list[tuple[Path, int, int]]) -> list[Optional[Track]]:
+    """Extract metadata for a batch of files, prefetching ahead of the parser.
+
+    Runs inside a metadata worker, so it must stay a top-level function.
+    """
+    for file_path, size_bytes, _ in batch[:PREFETCH_DEPTH]:
+        _prefetch_file(file_path, size_bytes)
+
+    results = []
+    for i, (file_path, size_bytes, mtime_ns) in enumerate(batch):
+        ahead = i + PREFETCH_DEPTH
+        if ahead < len(batch):
+            _prefetch_file(batch[ahead][0], batch[ahead][1])
+        results.append(extract_metadata(file_path, size_bytes, mtime_ns))
+
+    return results
+
+
+def _create_metadata_executor(config: Config) -> Executor:
+    """Create the executor used for parallel metadata extraction.
+
+    Uses a process pool by default. A thread pool is used when configured
+    with metadata_executor = "thread", which suits slow network mounts
+    where the work is dominated by waiting on file I/O.
+    """
+    workers = os.cpu_count() or 1
+    if config.metadata_executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+@dataclass(slots=True)
 class IndexResult:
     """Result of building the music index."""
 
-    def __init__(self, tracks: list[Track], errors: list[ScanError]):
-        self.tracks = tracks
-        self.errors = errors
+    tracks: list[Track]
+    errors: list[ScanError]
+    # Copies dropped by deduplication, cached so rescans needn't re-read them
+    duplicates: list[Track] = field(default_factory=list)
 
     @property
     def has_errors(self) -> bool:
@@ -244,6 +468,7 @@ class IndexResult:
 def build_index(
     config: Config,
     progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    incremental: bool = True,
 ) -> IndexResult:
     """Build a music library index from configured source directories.
 
@@ -253,11 +478,15 @@ def build_index(
     Args:
         config: Application configuration.
         progress_callback: Optional callback(status_message, current, total).
+        incremental: If True, reuse cached tracks whose file size and
+            modification time are unchanged instead of re-reading their tags.
+            This includes the duplicates dropped last time, which are
+            deduplicated again together with everything else.
 
     Returns:
         IndexResult with tracks and any errors encountered.
     """
-    all_files: list[Path] = []
+    all_files: list[tuple[Path, int, int]] = []
     errors: list[ScanError] = []
 
     # Scan all source directories
@@ -265,31 +494,63 @@ def build_index(
         if progress_callback:
             progress_callback(f"Scanning {source_path.name}...", 0, 0)
 
-        result = scan_directory(source_path, config.music_extensions)
+        result = scan_directory(source_path, config.music_extensions, workers=config.scan_workers)
         all_files.extend(result.files)
 
         if result.error:
             errors.append(result.error)
 
-    # Extract metadata from all files
     tracks: list[Track] = []
     total_files = len(all_files)
 
-    for i, file_path in enumerate(all_files):
-        if progress_callback:
-            progress_callback("Reading metadata...", i + 1, total_files)
+    # Reuse cached tracks for files that haven't changed since the last scan
+    to_extract = all_files
+    if incremental:
+        cached = {track.path: track for track in load_cache(include_duplicates=True) or []}
+        to_extract = []
+        for entry in all_files:
+            file_path, size_bytes, mtime_ns = entry
+            previous = cached.get(file_path)
+            if previous and previous.size_bytes == size_bytes and previous.mtime_ns == mtime_ns:
+                tracks.append(previous)
+            else:
+                to_extract.append(entry)
+
+    completed = len(tracks)
+    if progress_callback and completed:
+        progress_callback("Reading metadata...", completed, total_files)
+
+    # Extract metadata from new or changed files in parallel
+    if to_extract:
+        with _create_metadata_executor(config) as executor:
+            # Tracks from worker processes arrive as unpickled copies, which
+            # skip Track.__post_init__ and so haven't shared their strings
+            from_processes = isinstance(executor, ProcessPoolExecutor)
+            batches = [
+                to_extract[start:start + METADATA_CHUNKSIZE]
+                for start in range(0, len(to_extract), METADATA_CHUNKSIZE)
+            ]
+            for batch_tracks in executor.map(_extract_metadata_batch, batches):
+                for track in batch_tracks:
+                    completed += 1
+                    if progress_callback:
+                        progress_callback("Reading metadata...", completed, total_files)
 
-        track = extract_metadata(file_path)
-        if track:
-            tracks.append(track)
+                    if track:
+                        tracks.append(_share_strings(track) if from_processes else track)
 
     # Deduplicate based on format preference
-    deduplicated = _deduplicate_tracks(tracks, config.format_preference)
+    duplicates: list[Track] = []
+    deduplicated = _deduplicate_tracks(tracks, config.format_preference, duplicates)
 
-    return IndexResult(deduplicated, errors)
+    return IndexResult(deduplicated, errors, duplicates)
 
 
-def _deduplicate_tracks(tracks: list[Track], format_preference: str) -> list[Track]:
+def _deduplicate_tracks(
+    tracks: list[Track],
+    format_preference: str,
+    dropped: Optional[list[Track]] = None,
+) -> list[Track]:
     """Remove duplicate tracks, keeping preferred format.
 
     When the same song exists in both MP3 and AAC, keep the preferred format.
@@ -297,31 +558,30 @@ def _deduplicate_tracks(tracks: list[Track], format_preference: str) -> list[Tra
     Args:
         tracks: List of all tracks (may contain duplicates).
         format_preference: "aac" or "mp3" - which format to prefer.
+        dropped: Optional list that the removed duplicates are appended to.
 
     Returns:
         Deduplicated list of tracks.
     """
-    # Group tracks by dedupe key
-    seen: dict[str, Track] = {}
+    preferred, other = ("aac", "mp3") if format_preference == "aac" else ("mp3", "aac")
+
+    # Group tracks by dedupe key, built inline from the precomputed lowercase
+    # fields to avoid a property call per track
+    seen: dict[tuple[str, str], Track] = {}
 
     for track in tracks:
-        key = track.dedupe_key
+        key = (track.title_lower, track.artist_lower)
+        existing = seen.setdefault(key, track)
 
-        if key not in seen:
-            # First time seeing this track
-            seen[key] = track
-        else:
-            # Duplicate found - keep preferred format
-            existing = seen[key]
+        if existing is track:
+            continue
 
-            if format_preference == "aac":
-                # Prefer AAC over MP3
-                if track.format == "aac" and existing.format == "mp3":
-                    seen[key] = track
-            else:
-                # Prefer MP3 over AAC
-                if track.format == "mp3" and existing.format == "aac":
-                    seen[key] = track
+        # Duplicate found - keep preferred format
+        if track.format == preferred and existing.format == other:
+            seen[key] = track
+            track = existing
+        if dropped is not None:
+            dropped.append(track)
 
     return list(seen.values())
 
@@ -330,6 +590,12 @@ def _deduplicate_tracks(tracks: list[Track], format_preference: str) -> list[Tra
 
 CACHE_FILENAME = "library_cache.json"
 
+# Order of the per-track values stored in each cache row
+CACHE_FIELDS = ["path", "title", "artist", "album", "genre", "size_bytes", "format", "mtime_ns"]
+
+# Most recently loaded cache: ((path, mtime_ns, size), tracks, duplicates)
+_loaded_cache: Optional[tuple[tuple[str, int, int], list[Track], list[Track]]] = None
+
 
 def get_cache_path() -> Path:
     """Get the path to the library cache file."""
@@ -338,7 +604,7 @@ def get_cache_path() -> Path:
 
 def cache_exists() -> bool:
     """Check if the library cache file exists."""
-    return get_cache_path().exists()
+    return os.path.exists(get_cache_path())
 
 
 def get_cache_info() -> Optional[dict]:
@@ -346,69 +612,156 @@ def get_cache_info() -> Optional[dict]:
 
     Returns None if cache doesn't exist or is invalid.
     """
-    cache_path = get_cache_path()
-    if not cache_path.exists():
-        return None
-
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
+        with open(get_cache_path(), "r", encoding="utf-8") as f:
             data = json.load(f)
             return {
                 "cached_at": data.get("cached_at", "Unknown"),
                 "track_count": len(data.get("tracks", [])),
             }
-    except (json.JSONDecodeError, KeyError):
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
         return None
 
 
-def save_cache(tracks: list[Track]) -> None:
-    """Save the library index to a JSON cache file."""
-    cache_path = get_cache_path()
+def save_cache(tracks: list[Track], duplicates: Collection[Track] = ()) -> None:
+    """Save the library index to a JSON cache file.
 
-    # Convert tracks to JSON-serializable format
-    tracks_data = []
-    for track in tracks:
-        track_dict = asdict(track)
-        track_dict["path"] = str(track.path)  # Convert Path to string
-        tracks_data.append(track_dict)
+    Args:
+        tracks: The deduplicated library.
+        duplicates: Tracks dropped by deduplication (IndexResult.duplicates).
+            They aren't part of the library, but an incremental rescan
+            reuses them instead of re-reading their tags.
+    """
+    cache_path = get_cache_path()
 
     cache_data = {
         "cached_at": datetime.now().isoformat(),
         "track_count": len(tracks),
-        "tracks": tracks_data,
+        "fields": CACHE_FIELDS,
+        "tracks": _cache_rows(tracks),
+        "duplicates": _cache_rows(duplicates),
     }
 
+    # json.dumps without indent uses the C encoder; json.dump with indent does not
     with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(cache_data, f, indent=2)
+        f.write(json.dumps(cache_data, separators=(",", ":")))
+
+    invalidate_cache()
+
+
+def _cache_rows(tracks: Collection[Track]) -> list[list]:
+    """Store each track as a compact row (see CACHE_FIELDS) rather than a dict."""
+    return [
+        [
+            str(track.path),
+            track.title,
+            track.artist,
+            track.album,
+            track.genre,
+            track.size_bytes,
+            track.format,
+            track.mtime_ns,
+        ]
+        for track in tracks
+    ]
+
+
+def invalidate_cache() -> None:
+    """Forget the in-memory copy of the cache so the next load re-reads the file."""
+    global _loaded_cache
+    _loaded_cache = None
+
+
+_new_track = object.__new__
+
 
+def _track_from_cache_row(row: list) -> Track:
+    """Build a Track from a cache row, bypassing the dataclass __init__.
 
-def load_cache() -> Optional[list[Track]]:
+    Assigns the slots directly, including the lowercase fields that
+    Track.__post_init__ would compute, so keep the two in sync.
+    """
+    # Rows written before mtime_ns was added fall back to 0
+    path, title, artist, album, genre, size_bytes, audio_format, *rest = row
+
+    track = _new_track(Track)
+    track.path = Path(path)
+    track.title = title
+    track.artist = artist
+    track.album = album
+    track.genre = genre
+    track.size_bytes = size_bytes
+    # Intern the format so every track shares the "mp3"/"aac" constants
+    # instead of holding its own decoded string
+    track.format = sys.intern(audio_format)
+    track.mtime_ns = rest[0] if rest else 0
+    track.title_lower = title.lower()
+    track.artist_lower = artist.lower()
+    track.album_lower = album.lower()
+    track.genre_lower = genre.lower()
+    return _share_strings(track)
+
+
+def load_cache(include_duplicates: bool = False) -> Optional[list[Track]]:
     """Load the library index from a JSON cache file.
 
+    The parsed tracks are kept in memory and reused until the cache file's
+    modification time or size changes.
+
+    Args:
+        include_duplicates: If True, also return the cached tracks that
+            deduplication dropped, after the library tracks.
+
     Returns None if cache doesn't exist or is invalid.
     """
+    global _loaded_cache
+
     cache_path = get_cache_path()
-    if not cache_path.exists():
+    try:
+        stat = cache_path.stat()
+    except OSError:
         return None
 
+    cache_key = (str(cache_path), stat.st_mtime_ns, stat.st_size)
+    if _loaded_cache is not None and _loaded_cache[0] == cache_key:
+        return _cached_tracks(_loaded_cache, include_duplicates)
+
     try:
         with open(cache_path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
+        rows = data.get("tracks", [])
+        # Rows are unpacked by position, so a cache whose column header isn't
+        # one this version writes (or wrote before mtime_ns) is stale. Older
+        # dict-per-track caches have no header and name their fields.
+        if rows and not isinstance(rows[0], dict) and data.get("fields") not in (
+            CACHE_FIELDS,
+            CACHE_FIELDS[:-1],
+        ):
+            return None
+
         tracks = []
-        for track_dict in data.get("tracks", []):
-            track = Track(
-                path=Path(track_dict["path"]),
-                title=track_dict["title"],
-                artist=track_dict["artist"],
-                album=track_dict["album"],
-                genre=track_dict["genre"],
-                size_bytes=track_dict["size_bytes"],
-                format=track_dict["format"],
-            )
-            tracks.append(track)
+        tracks_append = tracks.append
+        for row in rows:
+            if isinstance(row, dict):
+                # Older caches stored one dict per track, without mtime_ns
+                row = [row[name] for name in CACHE_FIELDS[:-1]]
+            tracks_append(_track_from_cache_row(row))
 
-        return tracks
+        # Caches written before duplicates were stored simply have none
+        duplicates = [_track_from_cache_row(row) for row in data.get("duplicates", [])]
 
-    except (json.JSONDecodeError, KeyError, TypeError):
+        _loaded_cache = (cache_key, tracks, duplicates)
+        return _cached_tracks(_loaded_cache, include_duplicates)
+
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
         return None
+
+
+def _cached_tracks(
+    loaded: tuple[tuple[str, int, int], list[Track], list[Track]],
+    include_duplicates: bool,
+) -> list[Track]:
+    """Return a fresh list of a loaded cache's tracks, optionally with its duplicates."""
+    _, tracks, duplicates = loaded
+    return tracks + duplicates if include_duplicates else list(tracks)
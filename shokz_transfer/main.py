@@ -1,5 +1,8 @@
 """Main entry point for Shokz Transfer Utility."""
 
+from datetime import datetime
+from typing import Optional
+
 from rich.console import Console
 from rich.table import Table
 
@@ -11,15 +14,16 @@ from .indexer import (
     cache_exists,
     get_cache_info,
     load_cache,
+    reset_shared_strings,
     save_cache,
 )
-from .search import SearchField, search_tracks
+from .search import SearchField, SearchIndex, build_search_index, search_tracks
 from .playlist import (
     Playlist,
     session_exists,
     get_session_info,
     load_session,
-    save_session,
+    flush_session_if_dirty,
     clear_session,
 )
 from .transfer import (
@@ -41,25 +45,33 @@ from .ui import (
     print_warning,
     print_info,
     create_progress,
+    throttle_progress,
 )
 
 # Application state
 library: list[Track] = []
+search_index: Optional[SearchIndex] = None
 playlist: Playlist
 config: Config
 
+# Main menu options, with the (track count, total bytes) they were built for
+_menu_cache: Optional[tuple[tuple[int, int], list[str]]] = None
+
 
-def scan_library(save_to_cache: bool = True) -> bool:
+def scan_library(save_to_cache: bool = True, incremental: bool = False) -> bool:
     """Scan the music library with progress display.
 
     Args:
         save_to_cache: If True, save the scanned library to cache file.
+        incremental: If True, only re-read tags for files that are new or
+            changed since the cached scan.
 
     Returns True if tracks were found, False otherwise.
     """
-    global library
+    global library, search_index
 
     console.print("\n[bold]Scanning music library...[/bold]")
+    reset_shared_strings()
 
     with create_progress() as progress:
         task = progress.add_task("Scanning...", total=None)
@@ -70,7 +82,7 @@ def scan_library(save_to_cache: bool = True) -> bool:
             else:
                 progress.update(task, description=status)
 
-        result = build_index(config, on_progress)
+        result = build_index(config, throttle_progress(on_progress), incremental=incremental)
 
     # Report any errors encountered
     if result.has_errors:
@@ -82,11 +94,12 @@ def scan_library(save_to_cache: bool = True) -> bool:
                 print_warning(error.message)
 
     library = result.tracks
+    search_index = build_search_index(library)
     print_success(f"Found {len(library)} tracks")
 
     # Save to cache if requested and tracks were found
     if save_to_cache and len(library) > 0:
-        save_cache(library)
+        save_cache(library, result.duplicates)
         print_info("Library cached for faster startup next time.")
 
     return len(library) > 0
@@ -97,9 +110,10 @@ def load_library_from_cache() -> bool:
 
     Returns True if cache was loaded successfully, False otherwise.
     """
-    global library
+    global library, search_index
 
     console.print("\n[bold]Loading library from cache...[/bold]")
+    reset_shared_strings()
 
     cached_tracks = load_cache()
     if cached_tracks is None:
@@ -107,6 +121,7 @@ def load_library_from_cache() -> bool:
         return False
 
     library = cached_tracks
+    search_index = build_search_index(library)
     print_success(f"Loaded {len(library)} tracks from cache")
     return True
 
@@ -123,7 +138,6 @@ def startup_library_choice() -> bool:
             # Parse and format the date
             cached_at = cache_info["cached_at"]
             try:
-                from datetime import datetime
                 dt = datetime.fromisoformat(cached_at)
                 date_str = dt.strftime("%Y-%m-%d %H:%M")
             except (ValueError, TypeError):
@@ -136,6 +150,7 @@ def startup_library_choice() -> bool:
                 "Library Options:",
                 [
                     f"Use cached library ({cache_info['track_count']} tracks) - Fast",
+                    "Quick rescan - Reads only new or changed files",
                     "Rescan NAS library - Slow but gets latest changes",
                 ],
             )
@@ -143,6 +158,8 @@ def startup_library_choice() -> bool:
             if choice == 0:
                 return load_library_from_cache()
             elif choice == 1:
+                return scan_library(save_to_cache=True, incremental=True)
+            elif choice == 2:
                 return scan_library(save_to_cache=True)
             else:
                 # User cancelled
@@ -169,7 +186,6 @@ def startup_playlist_session() -> bool:
     # Parse and format the date
     saved_at = info["saved_at"]
     try:
-        from datetime import datetime
         dt = datetime.fromisoformat(saved_at)
         date_str = dt.strftime("%Y-%m-%d %H:%M")
     except (ValueError, TypeError):
@@ -230,7 +246,7 @@ def search_and_add() -> None:
         return
 
     # Search
-    results = search_tracks(library, query, field)
+    results = search_tracks(library, query, field, search_index)
 
     if not results:
         print_warning(f"No tracks found matching '{query}'")
@@ -260,8 +276,8 @@ def search_and_add() -> None:
         print_success(f"Added {added} tracks ({total_mb:.1f} MB) to playlist.")
         console.print(f"[dim]{playlist.get_status_message()}[/dim]")
 
-        # Auto-save playlist session
-        save_session(playlist)
+        # Auto-save playlist session on return to the main menu
+        playlist.mark_dirty()
 
         if playlist.is_over_capacity:
             print_warning("Playlist exceeds Shokz capacity! Remove some tracks before transferring.")
@@ -296,11 +312,8 @@ def view_playlist() -> None:
             if indices:
                 removed = playlist.remove_many(indices)
                 print_success(f"Removed {len(removed)} tracks.")
-                # Auto-save playlist session
-                if playlist.count > 0:
-                    save_session(playlist)
-                else:
-                    clear_session()
+                # Auto-save playlist session on return to the main menu
+                playlist.mark_dirty()
             else:
                 print_info("No tracks removed.")
 
@@ -323,13 +336,13 @@ def view_shokz_contents() -> None:
         print_error(f"Shokz not connected at {config.target}")
         return
 
-    files = get_shokz_contents(config.target, config.music_extensions)
+    files = get_shokz_contents(config.target, config.music_extensions_set)
 
     if not files:
         print_info("No music files on Shokz.")
         return
 
-    total_mb, count = get_shokz_usage(config.target, config.music_extensions)
+    total_mb, count = get_shokz_usage(config.target, config.music_extensions_set)
 
     table = Table(title="Shokz Contents")
     table.add_column("#", justify="right", style="cyan", width=4)
@@ -350,13 +363,15 @@ def archive_shokz() -> None:
         print_error(f"Shokz not connected at {config.target}")
         return
 
-    total_mb, count = get_shokz_usage(config.target, config.music_extensions)
+    # List the files here so archive_shokz_contents reuses this listing
+    files = get_shokz_contents(config.target, config.music_extensions_set)
 
-    if count == 0:
+    if not files:
         print_warning("No music files on Shokz to archive.")
         return
 
-    console.print(f"\n[dim]Archiving {count} files ({total_mb:.1f} MB)...[/dim]")
+    total_mb = sum(f.size_bytes for f in files) / (1024 * 1024)
+    console.print(f"\n[dim]Archiving {len(files)} files ({total_mb:.1f} MB)...[/dim]")
 
     success, result = archive_shokz_contents(config)
 
@@ -407,7 +422,7 @@ def transfer_playlist() -> None:
         result = perform_full_transfer(
             playlist.tracks,
             config,
-            progress_callback=on_progress,
+            progress_callback=throttle_progress(on_progress),
         )
 
     console.print()
@@ -426,6 +441,13 @@ def transfer_playlist() -> None:
 
 def show_main_menu() -> int:
     """Display main menu and return choice."""
+    global _menu_cache
+
+    # Reuse the options until the playlist summary they show changes
+    key = (playlist.count, playlist.total_size_bytes)
+    if _menu_cache is not None and _menu_cache[0] == key:
+        return prompt_menu("Main Menu:", _menu_cache[1])
+
     # Build menu with dynamic playlist info
     playlist_info = f"({playlist.count} tracks, {playlist.total_size_mb:.1f} MB)"
 
@@ -436,9 +458,11 @@ def show_main_menu() -> int:
         "Archive Shokz Contents",
         "Transfer Playlist to Shokz",
         "Rescan Library",
+        "Quick Rescan (changed files only)",
         "Exit",
     ]
 
+    _menu_cache = (key, options)
     return prompt_menu("Main Menu:", options)
 
 
@@ -471,27 +495,33 @@ def main() -> None:
     # Check for saved playlist session
     startup_playlist_session()
 
-    # Main menu loop
-    while True:
-        console.print()
-        choice = show_main_menu()
-
-        if choice == 0:
-            search_and_add()
-        elif choice == 1:
-            view_playlist()
-        elif choice == 2:
-            view_shokz_contents()
-        elif choice == 3:
-            archive_shokz()
-        elif choice == 4:
-            transfer_playlist()
-        elif choice == 5:
-            scan_library()
-        elif choice == 6 or choice == -1:
+    # Main menu loop; the finally saves pending playlist edits even on Ctrl-C
+    try:
+        while True:
+            flush_session_if_dirty(playlist)
             console.print()
-            print_info("Goodbye!")
-            break
+            choice = show_main_menu()
+
+            if choice == 0:
+                search_and_add()
+            elif choice == 1:
+                view_playlist()
+            elif choice == 2:
+                view_shokz_contents()
+            elif choice == 3:
+                archive_shokz()
+            elif choice == 4:
+                transfer_playlist()
+            elif choice == 5:
+                scan_library()
+            elif choice == 6:
+                scan_library(incremental=True)
+            elif choice == 7 or choice == -1:
+                console.print()
+                print_info("Goodbye!")
+                break
+    finally:
+        flush_session_if_dirty(playlist)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 """Playlist management for track selection."""
 
+import hashlib
 import json
+import os
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -12,35 +15,59 @@ from .indexer import Track
 # Session file for playlist persistence
 SESSION_FILENAME = "playlist_session.json"
 
+# Set this environment variable to write the session file indented for reading
+PRETTY_SESSION_ENV = "SHOKZ_PRETTY_SESSION"
+
+# Digest of the last playlist contents written to the session file
+_last_session_hash: Optional[bytes] = None
+
 
 def get_session_path() -> Path:
     """Get the path to the playlist session file."""
     return Path(__file__).parent.parent / SESSION_FILENAME
 
 
+def get_session_meta_path() -> Path:
+    """Get the path to the sidecar file holding the session summary."""
+    return get_session_path().with_suffix(".meta.json")
+
+
 def session_exists() -> bool:
     """Check if a saved playlist session exists."""
-    return get_session_path().exists()
+    return os.path.exists(get_session_path())
 
 
 def get_session_info() -> Optional[dict]:
     """Get session metadata (date, track count, size) without loading all tracks.
 
+    Reads the small sidecar written by save_session, falling back to the
+    full session file for sessions saved without one.
+
     Returns None if session doesn't exist or is invalid.
     """
-    session_path = get_session_path()
-    if not session_path.exists():
+    if not session_exists():
         return None
 
     try:
-        with open(session_path, "r", encoding="utf-8") as f:
+        with open(get_session_meta_path(), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+            return {
+                "saved_at": meta["saved_at"],
+                "track_count": meta["track_count"],
+                "total_size_mb": meta["total_size_mb"],
+            }
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+
+    try:
+        with open(get_session_path(), "r", encoding="utf-8") as f:
             data = json.load(f)
             return {
                 "saved_at": data.get("saved_at", "Unknown"),
                 "track_count": data.get("track_count", 0),
                 "total_size_mb": data.get("total_size_mb", 0),
             }
-    except (json.JSONDecodeError, KeyError):
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
         return None
 
 
@@ -50,9 +77,14 @@ def save_session(playlist: "Playlist") -> bool:
     Args:
         playlist: The playlist to save.
 
+    The write is skipped when the tracks and capacity match what was last
+    saved, and otherwise goes through a temp file so an interrupted save
+    never leaves a truncated session behind.
+
     Returns:
         True if saved successfully, False otherwise.
     """
+    global _last_session_hash
     session_path = get_session_path()
 
     # Convert tracks to JSON-serializable format
@@ -68,22 +100,70 @@ def save_session(playlist: "Playlist") -> bool:
             "format": track.format,
         })
 
-    session_data = {
+    content_hash = hashlib.blake2b(
+        json.dumps([playlist.capacity_mb, tracks_data], separators=(",", ":")).encode("utf-8"),
+        digest_size=16,
+    ).digest()
+    if content_hash == _last_session_hash and session_path.exists():
+        return True
+
+    meta_data = {
         "saved_at": datetime.now().isoformat(),
         "track_count": playlist.count,
         "total_size_mb": round(playlist.total_size_mb, 2),
+    }
+    session_data = {
+        **meta_data,
         "capacity_mb": playlist.capacity_mb,
         "tracks": tracks_data,
     }
 
+    if not _write_atomic(session_path, _encode_session(session_data)):
+        return False
+
+    # A stale summary is worse than none, so drop it if it can't be updated
+    meta_path = get_session_meta_path()
+    if not _write_atomic(meta_path, json.dumps(meta_data)):
+        try:
+            meta_path.unlink()
+        except OSError:
+            pass
+
+    _last_session_hash = content_hash
+    return True
+
+
+def _write_atomic(path: Path, text: str) -> bool:
+    """Write text to a temp file beside path, then move it into place.
+
+    Returns:
+        True if written successfully, False otherwise.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
     try:
-        with open(session_path, "w", encoding="utf-8") as f:
-            json.dump(session_data, f, indent=2)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
         return True
     except (IOError, OSError):
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
         return False
 
 
+def _encode_session(session_data: dict) -> str:
+    """Encode session data as JSON.
+
+    Written compactly by default, which lets json use its C encoder.
+    Set SHOKZ_PRETTY_SESSION=1 to get an indented file for debugging.
+    """
+    if os.environ.get(PRETTY_SESSION_ENV):
+        return json.dumps(session_data, indent=2)
+    return json.dumps(session_data, separators=(",", ":"))
+
+
 def load_session() -> Optional["Playlist"]:
     """Load a saved playlist session.
 
@@ -109,9 +189,9 @@ def load_session() -> Optional["Playlist"]:
                 album=track_dict["album"],
                 genre=track_dict["genre"],
                 size_bytes=track_dict["size_bytes"],
-                format=track_dict["format"],
+                format=sys.intern(track_dict["format"]),
             )
-            playlist._tracks.append(track)
+            playlist.add(track)
 
         return playlist
 
@@ -119,21 +199,40 @@ def load_session() -> Optional["Playlist"]:
         return None
 
 
+def flush_session_if_dirty(playlist: "Playlist") -> bool:
+    """Write the session file if the playlist changed since the last flush.
+
+    An empty playlist removes the session file instead of saving it.
+
+    Returns:
+        True if the session is up to date, False if writing failed.
+    """
+    if not playlist.is_dirty:
+        return True
+
+    saved = save_session(playlist) if playlist.count > 0 else clear_session()
+    if saved:
+        playlist._dirty = False
+    return saved
+
+
 def clear_session() -> bool:
-    """Delete the session file after successful transfer.
+    """Delete the session file and its summary after successful transfer.
 
     Returns:
         True if deleted or didn't exist, False on error.
     """
-    session_path = get_session_path()
-    if not session_path.exists():
-        return True
+    global _last_session_hash
+    _last_session_hash = None
+    for path in (get_session_meta_path(), get_session_path()):
+        if not path.exists():
+            continue
 
-    try:
-        session_path.unlink()
-        return True
-    except (IOError, OSError):
-        return False
+        try:
+            path.unlink()
+        except (IOError, OSError):
+            return False
+    return True
 
 
 @dataclass
@@ -143,6 +242,16 @@ class Playlist:
     capacity_mb: int = 4000
     _tracks: list[Track] = field(default_factory=list)
 
+    # Internal state set in __post_init__, not constructor arguments
+    _paths: set[Path] = field(init=False, repr=False, compare=False)  # Paths in _tracks, for duplicate checks
+    _total_bytes: int = field(init=False, repr=False, compare=False)  # Running sum of size_bytes in _tracks
+    _dirty: bool = field(init=False, repr=False, compare=False)  # Changed since the session was last flushed
+
+    def __post_init__(self) -> None:
+        self._paths = {t.path for t in self._tracks}
+        self._total_bytes = sum(t.size_bytes for t in self._tracks)
+        self._dirty = False
+
     @property
     def tracks(self) -> list[Track]:
         """Return a copy of the track list."""
@@ -156,12 +265,21 @@ class Playlist:
     @property
     def total_size_bytes(self) -> int:
         """Return total size of all tracks in bytes."""
-        return sum(t.size_bytes for t in self._tracks)
+        return self._total_bytes
 
     @property
     def total_size_mb(self) -> float:
         """Return total size of all tracks in MB."""
-        return self.total_size_bytes / (1024 * 1024)
+        return self._total_bytes / (1024 * 1024)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Return True if the playlist has unsaved changes."""
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """Flag the playlist as needing a session save."""
+        self._dirty = True
 
     @property
     def remaining_mb(self) -> float:
@@ -197,11 +315,12 @@ class Playlist:
             True if added, False if already in playlist.
         """
         # Check for duplicate by path
-        for existing in self._tracks:
-            if existing.path == track.path:
-                return False
+        if track.path in self._paths:
+            return False
 
+        self._paths.add(track.path)
         self._tracks.append(track)
+        self._total_bytes += track.size_bytes
         return True
 
     def add_many(self, tracks: list[Track]) -> int:
@@ -229,24 +348,37 @@ class Playlist:
             The removed track, or None if index invalid.
         """
         if 0 <= index < len(self._tracks):
-            return self._tracks.pop(index)
+            track = self._tracks.pop(index)
+            self._paths.discard(track.path)
+            self._total_bytes -= track.size_bytes
+            return track
         return None
 
     def remove_many(self, indices: list[int]) -> list[Track]:
         """Remove multiple tracks by index.
 
         Args:
-            indices: List of 0-based indices to remove.
+            indices: List of 0-based indices to remove. Out-of-range and
+                repeated indices are ignored.
 
         Returns:
-            List of removed tracks.
+            List of removed tracks, in playlist order.
         """
-        # Sort indices in reverse order to avoid index shifting issues
+        # Rebuild the list in one pass instead of popping each index
+        to_remove = set(indices)
         removed = []
-        for index in sorted(indices, reverse=True):
-            track = self.remove(index)
-            if track:
+        kept = []
+        for index, track in enumerate(self._tracks):
+            if index in to_remove:
                 removed.append(track)
+            else:
+                kept.append(track)
+
+        if removed:
+            self._tracks = kept
+            for track in removed:
+                self._paths.discard(track.path)
+                self._total_bytes -= track.size_bytes
         return removed
 
     def clear(self) -> int:
@@ -257,6 +389,8 @@ class Playlist:
         """
         count = len(self._tracks)
         self._tracks.clear()
+        self._paths.clear()
+        self._total_bytes = 0
         return count
 
     def get_status_message(self) -> str:
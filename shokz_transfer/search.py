@@ -1,7 +1,10 @@
 """Search and filter logic for music library."""
 
+from bisect import bisect_right
+from collections import OrderedDict
 from enum import Enum
-from typing import Callable
+from operator import attrgetter
+from typing import Callable, Optional
 
 from .indexer import Track
 
@@ -15,10 +18,123 @@ class SearchField(Enum):
     GENRE = "genre"
 
 
+# Lowercase field getters, using the values precomputed on each Track
+_FIELD_LOWER_GETTERS: dict[SearchField, Callable[[Track], str]] = {
+    SearchField.TITLE: attrgetter("title_lower"),
+    SearchField.ALBUM: attrgetter("album_lower"),
+    SearchField.ARTIST: attrgetter("artist_lower"),
+    SearchField.GENRE: attrgetter("genre_lower"),
+}
+
+# Length of the substrings indexed by SearchIndex
+TRIGRAM_LENGTH = 3
+
+# Number of recent query results each SearchIndex remembers
+RESULT_CACHE_SIZE = 128
+
+
+class SearchIndex:
+    """Trigram index over the lowercase track fields for substring search.
+
+    Maps every 3-character substring of a field to the indices of the tracks
+    containing it. A field's postings are built the first time it is searched.
+    Results of recent queries are also kept, so repeating a search is a
+    lookup and extending one only rechecks the previous matches.
+    """
+
+    def __init__(self, tracks: list[Track]):
+        self.tracks = tracks
+        self._trigrams: dict[SearchField, dict[str, list[int]]] = {}
+        self._results: OrderedDict[tuple[SearchField, str], list[int]] = OrderedDict()
+
+    def matches(self, search_field: SearchField, query_lower: str) -> list[int]:
+        """Return indices of tracks whose field contains the query."""
+        key = (search_field, query_lower)
+        cached = self._results.get(key)
+        if cached is not None:
+            self._results.move_to_end(key)
+            return cached
+
+        # Any match for "abc" also matches its prefix "ab", so start from the
+        # longest prefix already searched, if there is one
+        candidates = None
+        for end in range(len(query_lower) - 1, 0, -1):
+            candidates = self._results.get((search_field, query_lower[:end]))
+            if candidates is not None:
+                break
+
+        if candidates is None:
+            candidates = self.candidates(search_field, query_lower)
+        if candidates is None:
+            candidates = range(len(self.tracks))
+
+        getter = _FIELD_LOWER_GETTERS[search_field]
+        tracks = self.tracks
+        result = [i for i in candidates if query_lower in getter(tracks[i])]
+
+        self._results[key] = result
+        if len(self._results) > RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return result
+
+    def candidates(self, search_field: SearchField, query_lower: str) -> Optional[list[int]]:
+        """Return indices of tracks that contain every trigram of the query.
+
+        Returns None if the query is too short to use the index.
+        """
+        if len(query_lower) < TRIGRAM_LENGTH:
+            return None
+
+        trigrams = self._field_trigrams(search_field)
+        query_grams = {
+            query_lower[i:i + TRIGRAM_LENGTH]
+            for i in range(len(query_lower) - TRIGRAM_LENGTH + 1)
+        }
+
+        postings = []
+        for gram in query_grams:
+            posting = trigrams.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        # Intersect starting from the rarest trigram
+        postings.sort(key=len)
+        matches = set(postings[0])
+        for posting in postings[1:]:
+            matches.intersection_update(posting)
+            if not matches:
+                return []
+
+        return sorted(matches)
+
+    def _field_trigrams(self, search_field: SearchField) -> dict[str, list[int]]:
+        """Get the trigram postings for a field, building them if needed."""
+        trigrams = self._trigrams.get(search_field)
+        if trigrams is None:
+            trigrams = {}
+            getter = _FIELD_LOWER_GETTERS[search_field]
+            for index, track in enumerate(self.tracks):
+                value = getter(track)
+                for gram in {value[i:i + TRIGRAM_LENGTH] for i in range(len(value) - TRIGRAM_LENGTH + 1)}:
+                    trigrams.setdefault(gram, []).append(index)
+            self._trigrams[search_field] = trigrams
+        return trigrams
+
+
+def build_search_index(tracks: list[Track]) -> SearchIndex:
+    """Create a search index for a track list.
+
+    Pass the result to search_tracks along with the same list.
+    """
+    return SearchIndex(tracks)
+
+
 def search_tracks(
     tracks: list[Track],
     query: str,
     field: SearchField,
+    index: Optional[SearchIndex] = None,
 ) -> list[Track]:
     """Search tracks by a specific field.
 
@@ -26,6 +142,9 @@ def search_tracks(
         tracks: List of tracks to search.
         query: Search query (case-insensitive substring match).
         field: Which field to search.
+        index: Optional SearchIndex built for tracks. Queries of three or more
+            characters then only check tracks sharing all of the query's trigrams,
+            and recent results are reused.
 
     Returns:
         List of matching tracks.
@@ -35,23 +154,74 @@ def search_tracks(
     if not query_lower:
         return []
 
-    # Get the appropriate field getter
-    field_getters: dict[SearchField, Callable[[Track], str]] = {
-        SearchField.TITLE: lambda t: t.title,
-        SearchField.ALBUM: lambda t: t.album,
-        SearchField.ARTIST: lambda t: t.artist,
-        SearchField.GENRE: lambda t: t.genre,
-    }
-
-    getter = field_getters[field]
+    if index is not None and index.tracks is tracks:
+        return [tracks[i] for i in index.matches(field, query_lower)]
 
+    getter = _FIELD_LOWER_GETTERS[field]
     return [
         track
         for track in tracks
-        if query_lower in getter(track).lower()
+        if query_lower in getter(track)
     ]
 
 
+# Separates track values when a field is joined into one string for batch_search
+_COLUMN_SEPARATOR = "\x00"
+
+
+def batch_search(
+    tracks: list[Track],
+    queries: dict[SearchField, list[str]],
+) -> dict[SearchField, dict[str, list[Track]]]:
+    """Run many substring searches against the library at once.
+
+    Each searched field is lowercased and joined into a single string once,
+    then every query is located with str.find over that string. This avoids
+    a Python-level loop over every track for every query.
+
+    Args:
+        tracks: List of tracks to search.
+        queries: Queries to run for each field (case-insensitive substring match).
+
+    Returns:
+        Dict mapping each field to a dict of query -> matching tracks, in
+        library order. Same matches as search_tracks for each query.
+    """
+    results: dict[SearchField, dict[str, list[Track]]] = {}
+
+    for field, field_queries in queries.items():
+        values = list(map(_FIELD_LOWER_GETTERS[field], tracks))
+        column = _COLUMN_SEPARATOR.join(values)
+
+        # Offset in column where each track's value starts
+        starts = []
+        offset = 0
+        for value in values:
+            starts.append(offset)
+            offset += len(value) + 1
+
+        field_results: dict[str, list[Track]] = {}
+        for query in field_queries:
+            query_lower = query.lower().strip()
+            matches: list[Track] = []
+
+            if query_lower and _COLUMN_SEPARATOR not in query_lower:
+                pos = column.find(query_lower)
+                while pos != -1:
+                    index = bisect_right(starts, pos) - 1
+                    matches.append(tracks[index])
+                    # Skip to the next track so each track matches at most once
+                    if index + 1 >= len(starts):
+                        break
+                    pos = column.find(query_lower, starts[index + 1])
+
+            field_results[query] = matches
+
+        results[field] = field_results
+
+    return results
+
+
 def search_by_title(tracks: list[Track], query: str) -> list[Track]:
     """Search tracks by title."""
     return search_tracks(tracks, query, SearchField.TITLE)
@@ -1,17 +1,47 @@
 """File transfer operations for Shokz device."""
 
+import errno
 import json
+import os
 import shutil
-from dataclasses import dataclass
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Collection, Iterator, Optional
 
 from .config import Config
 from .indexer import Track
 
+# Seconds a device listing is reused for, as long as the mount point's mtime
+# is unchanged (changes deeper in the tree don't touch it, so keep this short)
+LISTING_CACHE_TTL = 5.0
 
-@dataclass
+# Bytes handed to each copy_file_range/sendfile call when copying a track
+COPY_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Buffer size for the read/write fallback; USB mass storage peaks around
+# 512 KiB-1 MiB per transfer, well above shutil's 64 KiB default
+COPY_BUFFER_BYTES = 1024 * 1024
+
+# Errors meaning a kernel copy call can't be used for this pair of files
+_KERNEL_COPY_UNSUPPORTED = frozenset({
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.ETXTBSY,
+})
+
+# Device listings by (mount point, extensions), with the mount point mtime
+# and monotonic time they were taken at
+_listing_cache: dict[tuple[Path, frozenset[str]], tuple[int, float, list["ShokzFile"]]] = {}
+
+
+@dataclass(slots=True)
 class TransferResult:
     """Result of a transfer operation."""
 
@@ -26,7 +56,7 @@ class TransferResult:
         return self.bytes_copied / (1024 * 1024)
 
 
-@dataclass
+@dataclass(slots=True)
 class ShokzFile:
     """Represents a file currently on the Shokz device."""
 
@@ -34,6 +64,12 @@ class ShokzFile:
     name: str
     size_bytes: int
 
+    # Case-folded copy of name, computed once for case-insensitive sorting
+    name_folded: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name_folded = self.name.casefold()
+
     @property
     def size_mb(self) -> float:
         """Return size in megabytes."""
@@ -49,18 +85,21 @@ def is_shokz_mounted(target_path: Path) -> bool:
     Returns:
         True if mounted and accessible.
     """
-    return target_path.exists() and target_path.is_dir()
+    return os.path.isdir(target_path)
 
 
 def get_shokz_contents(
     target_path: Path,
-    music_extensions: list[str],
+    music_extensions: Collection[str],
 ) -> list[ShokzFile]:
     """List music files currently on the Shokz device.
 
+    A listing is reused for a few seconds while the mount point is
+    unchanged, so back-to-back calls within one action walk the device once.
+
     Args:
         target_path: Path to Shokz mount point.
-        music_extensions: List of music file extensions.
+        music_extensions: Music file extensions, ideally Config.music_extensions_set.
 
     Returns:
         List of ShokzFile objects.
@@ -68,54 +107,154 @@ def get_shokz_contents(
     if not is_shokz_mounted(target_path):
         return []
 
-    files = []
-    extensions_lower = [ext.lower() for ext in music_extensions]
+    extensions = _extension_set(music_extensions)
+    cached = _get_cached_listing(target_path, extensions)
+    if cached is not None:
+        return list(cached)
 
-    for file_path in target_path.rglob("*"):
-        # Skip hidden files and directories
-        if any(part.startswith(".") for part in file_path.parts):
-            continue
+    # Taken before the walk, so changes made during it invalidate the listing
+    taken_at = time.monotonic()
+    try:
+        root_mtime = os.stat(target_path).st_mtime_ns
+    except OSError:
+        return []
 
-        if file_path.is_file() and file_path.suffix.lower() in extensions_lower:
-            files.append(
-                ShokzFile(
-                    path=file_path,
-                    name=file_path.name,
-                    size_bytes=file_path.stat().st_size,
-                )
-            )
+    files = [
+        ShokzFile(
+            path=Path(entry.path),
+            name=entry.name,
+            size_bytes=entry.stat().st_size,
+        )
+        for entry in _iter_music_entries(target_path, extensions)
+    ]
+    _listing_cache[(target_path, extensions)] = (root_mtime, taken_at, files)
+    return list(files)
 
+
+def _get_cached_listing(target_path: Path, extensions: frozenset[str]) -> Optional[list[ShokzFile]]:
+    """Return the cached listing for a device if it is still fresh, else None."""
+    cached = _listing_cache.get((target_path, extensions))
+    if cached is None:
+        return None
+
+    root_mtime, taken_at, files = cached
+    if time.monotonic() - taken_at >= LISTING_CACHE_TTL:
+        return None
+    try:
+        if os.stat(target_path).st_mtime_ns != root_mtime:
+            return None
+    except OSError:
+        return None
     return files
 
 
-def get_shokz_usage(target_path: Path, music_extensions: list[str]) -> tuple[float, int]:
+def _extension_set(music_extensions: Collection[str]) -> frozenset[str]:
+    """Return extensions as a lowercase frozenset.
+
+    A frozenset is assumed to be lowercase already (as Config builds it)
+    and is returned unchanged.
+    """
+    if isinstance(music_extensions, frozenset):
+        return music_extensions
+    return frozenset(ext.lower() for ext in music_extensions)
+
+
+def _has_music_extension(name: str, extensions: frozenset[str]) -> bool:
+    """Check a filename's suffix against a lowercase extension set.
+
+    Slices the suffix off the name rather than building a PurePath.
+    """
+    dot = name.rfind(".")
+    return dot > 0 and name[dot:].lower() in extensions
+
+
+def _invalidate_listing_cache(target_path: Path) -> None:
+    """Drop cached listings for a device after its files have changed."""
+    for key in [key for key in _listing_cache if key[0] == target_path]:
+        del _listing_cache[key]
+
+
+def _iter_music_entries(
+    root_path: Path,
+    extensions: frozenset[str],
+) -> Iterator[os.DirEntry]:
+    """Yield directory entries for music files under root_path.
+
+    Walks with os.scandir so type checks and sizes come from the directory
+    entry. Hidden files and directories are skipped, along with everything
+    inside them, and unreadable directories are ignored. Files are yielded
+    in the same order as Path.rglob.
+    """
+    pending = [str(root_path)]
+
+    while pending:
+        current = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    if _has_music_extension(entry.name, extensions) and entry.is_file():
+                        yield entry
+        except PermissionError:
+            continue
+
+        # Reversed so the first subdirectory is walked next
+        pending.extend(reversed(subdirs))
+
+
+def get_shokz_usage(target_path: Path, music_extensions: Collection[str]) -> tuple[float, int]:
     """Get total size and count of music files on Shokz.
 
     Args:
         target_path: Path to Shokz mount point.
-        music_extensions: List of music file extensions.
+        music_extensions: Music file extensions, ideally Config.music_extensions_set.
 
     Returns:
         Tuple of (total_mb, file_count).
     """
-    files = get_shokz_contents(target_path, music_extensions)
-    total_bytes = sum(f.size_bytes for f in files)
-    return total_bytes / (1024 * 1024), len(files)
+    if not is_shokz_mounted(target_path):
+        return 0.0, 0
+
+    extensions = _extension_set(music_extensions)
+    files = _get_cached_listing(target_path, extensions)
+    if files is not None:
+        total_bytes = sum(f.size_bytes for f in files)
+        return total_bytes / (1024 * 1024), len(files)
+
+    total_bytes, count = _walk_sizes(target_path, extensions)
+    return total_bytes / (1024 * 1024), count
+
+
+def _walk_sizes(target_path: Path, extensions: frozenset[str]) -> tuple[int, int]:
+    """Sum the size and count of music files without building ShokzFile objects."""
+    total_bytes = 0
+    count = 0
+    for entry in _iter_music_entries(target_path, extensions):
+        total_bytes += entry.stat().st_size
+        count += 1
+    return total_bytes, count
 
 
 def clear_shokz_music(
     target_path: Path,
-    music_extensions: list[str],
+    music_extensions: Collection[str],
     progress_callback: Optional[Callable[[str, int, int], None]] = None,
 ) -> tuple[int, list[str]]:
     """Remove all music files from Shokz device.
 
-    Preserves system files and hidden files/directories.
+    Preserves system files and hidden files/directories. Files are deleted
+    and emptied directories removed in a single bottom-up walk.
 
     Args:
         target_path: Path to Shokz mount point.
-        music_extensions: List of music file extensions to remove.
-        progress_callback: Optional callback(filename, current, total).
+        music_extensions: Music file extensions to remove, ideally Config.music_extensions_set.
+        progress_callback: Optional callback(filename, current, total). The
+            total isn't known during the single walk and is passed as 0.
 
     Returns:
         Tuple of (files_deleted, list_of_errors).
@@ -123,51 +262,79 @@ def clear_shokz_music(
     if not is_shokz_mounted(target_path):
         return 0, ["Shokz device not mounted"]
 
-    files = get_shokz_contents(target_path, music_extensions)
-    total = len(files)
-    deleted = 0
-    errors = []
+    return _clear_shokz_music_unchecked(target_path, music_extensions, progress_callback)
 
-    for i, shokz_file in enumerate(files):
-        if progress_callback:
-            progress_callback(shokz_file.name, i + 1, total)
 
-        try:
-            shokz_file.path.unlink()
-            deleted += 1
-        except OSError as e:
-            errors.append(f"Failed to delete {shokz_file.name}: {e}")
-
-    # Clean up empty directories (but not the root or hidden dirs)
-    _remove_empty_dirs(target_path)
+def _clear_shokz_music_unchecked(
+    target_path: Path,
+    music_extensions: Collection[str],
+    progress_callback: Optional[Callable[[str, int, int], None]] = None,
+) -> tuple[int, list[str]]:
+    """clear_shokz_music without the mount check, for callers that already made it."""
+    errors: list[str] = []
+    deleted = _clear_recursive(
+        str(target_path),
+        _extension_set(music_extensions),
+        errors,
+        progress_callback,
+    )
+    _invalidate_listing_cache(target_path)
 
     return deleted, errors
 
 
-def _remove_empty_dirs(root_path: Path) -> None:
-    """Remove empty directories under root_path.
+def _clear_recursive(
+    directory: str,
+    extensions: frozenset[str],
+    errors: list[str],
+    progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    deleted: int = 0,
+) -> int:
+    """Delete music files under directory, removing subdirectories left empty.
+
+    Hidden entries are skipped and unreadable directories ignored. The
+    directory itself is never removed, so the caller's root stays put.
 
-    Preserves the root directory and hidden directories.
+    Returns:
+        Running count of files deleted, starting from deleted.
     """
-    # Walk bottom-up to remove empty dirs
-    for dir_path in sorted(root_path.rglob("*"), reverse=True):
-        # Skip hidden directories
-        if any(part.startswith(".") for part in dir_path.parts):
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except PermissionError:
+        return deleted
+
+    for entry in entries:
+        name = entry.name
+        if name.startswith("."):
             continue
 
-        if dir_path.is_dir():
+        if entry.is_dir(follow_symlinks=False):
+            deleted = _clear_recursive(entry.path, extensions, errors, progress_callback, deleted)
             try:
                 # Only removes if empty
-                dir_path.rmdir()
+                os.rmdir(entry.path)
             except OSError:
                 # Directory not empty or other error - skip
                 pass
+        elif _has_music_extension(name, extensions) and entry.is_file():
+            try:
+                os.unlink(entry.path)
+                deleted += 1
+            except OSError as e:
+                errors.append(f"Failed to delete {name}: {e}")
+
+            if progress_callback:
+                progress_callback(name, deleted, 0)
+
+    return deleted
 
 
 def transfer_to_shokz(
     tracks: list[Track],
     target_path: Path,
     progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    workers: int = 1,
 ) -> TransferResult:
     """Copy tracks to Shokz device.
 
@@ -177,7 +344,10 @@ def transfer_to_shokz(
     Args:
         tracks: List of tracks to copy.
         target_path: Path to Shokz mount point.
-        progress_callback: Optional callback(filename, current, total).
+        progress_callback: Optional callback(filename, current, total), called
+            as each copy finishes.
+        workers: Number of files copied at once. Several copies in flight let
+            reading the next file overlap the device finishing the last one.
 
     Returns:
         TransferResult with success status and statistics.
@@ -190,27 +360,63 @@ def transfer_to_shokz(
             errors=["Shokz device not mounted"],
         )
 
+    return _transfer_to_shokz_unchecked(tracks, target_path, progress_callback, workers)
+
+
+def _transfer_to_shokz_unchecked(
+    tracks: list[Track],
+    target_path: Path,
+    progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    workers: int = 1,
+) -> TransferResult:
+    """transfer_to_shokz without the mount check, for callers that already made it."""
     total = len(tracks)
     copied = 0
     bytes_copied = 0
-    errors = []
-    used_names: set[str] = set()
+    errors_by_index: dict[int, str] = {}
 
-    for i, track in enumerate(tracks):
-        if progress_callback:
-            progress_callback(track.title, i + 1, total)
+    # Pick every destination name up front, before any copies run in parallel
+    plan = _plan_destinations(tracks, target_path)
+    # The Shokz plays files in the order their directory entries were
+    # created, so with parallel copies create them in playlist order first
+    precreate = workers > 1
 
-        # Generate unique filename
-        dest_name = _get_unique_filename(track.path.name, used_names)
-        used_names.add(dest_name.lower())
-        dest_path = target_path / dest_name
+    jobs: list[tuple[int, Track, Path]] = []
+    futures: dict[Future, int] = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        for i, (track, dest_path) in enumerate(plan):
+            if precreate:
+                try:
+                    open(dest_path, "wb").close()
+                except OSError as e:
+                    errors_by_index[i] = f"Failed to copy {track.title}: {e}"
+                    continue
+            jobs.append((i, track, dest_path))
+
+        for job, (i, track, dest_path) in enumerate(jobs):
+            futures[executor.submit(_copy_file, track.path, dest_path)] = job
+
+        for done, future in enumerate(as_completed(futures), start=total - len(jobs) + 1):
+            i, track, dest_path = jobs[futures[future]]
+            if progress_callback:
+                progress_callback(track.title, done, total)
 
-        try:
-            shutil.copy2(track.path, dest_path)
-            copied += 1
-            bytes_copied += track.size_bytes
-        except OSError as e:
-            errors.append(f"Failed to copy {track.title}: {e}")
+            try:
+                future.result()
+                copied += 1
+                bytes_copied += track.size_bytes
+            except OSError as e:
+                errors_by_index[i] = f"Failed to copy {track.title}: {e}"
+    finally:
+        # Don't start queued copies if we're leaving early (e.g. Ctrl-C);
+        # this waits for the copies already running
+        executor.shutdown(cancel_futures=True)
+        _remove_unfinished_copies(jobs, futures, precreate)
+        _invalidate_listing_cache(target_path)
+
+    # Report errors in playlist order, not completion order
+    errors = [errors_by_index[i] for i in sorted(errors_by_index)]
 
     return TransferResult(
         success=len(errors) == 0,
@@ -220,17 +426,150 @@ def transfer_to_shokz(
     )
 
 
-def _get_unique_filename(original_name: str, used_names: set[str]) -> str:
+def _remove_unfinished_copies(
+    jobs: list[tuple[int, Track, Path]],
+    futures: dict[Future, int],
+    precreated: bool,
+) -> None:
+    """Delete destination files whose copy failed, was cancelled, or never started.
+
+    Called once the executor has shut down, so every submitted future is
+    done, so that no empty or partial file is left on the device.
+    """
+    submitted = {job: future for future, job in futures.items()}
+    for job, (_, _, dest_path) in enumerate(jobs):
+        future = submitted.get(job)
+        if future is None or future.cancelled():
+            # Never started; the file only exists if it was pre-created
+            if precreated:
+                _unlink_quietly(dest_path)
+        elif future.exception() is not None:
+            # A failed copy may have left an empty or partial file
+            _unlink_quietly(dest_path)
+
+
+def _unlink_quietly(path: Path) -> None:
+    """Delete a file, ignoring errors such as it being already gone."""
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def _plan_destinations(tracks: list[Track], target_path: Path) -> list[tuple[Track, Path]]:
+    """Pair each track with its unique destination path on the device.
+
+    Names are resolved in playlist order, so the first of several tracks
+    sharing a filename keeps it and later ones get number suffixes.
+    """
+    used_names: set[str] = set()
+    name_counters: dict[str, int] = {}
+    plan: list[tuple[Track, Path]] = []
+    for track in tracks:
+        original_name = track.path.name
+        original_lower = original_name.lower()
+        dest_name = _get_unique_filename(original_name, used_names, name_counters, original_lower)
+        used_names.add(original_lower if dest_name == original_name else dest_name.lower())
+        plan.append((track, target_path / dest_name))
+    return plan
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a file's contents to dst, leaving its metadata behind.
+
+    On Linux the kernel moves the data itself (copy_file_range, or sendfile
+    where that isn't supported). Elsewhere shutil.copyfile takes the
+    platform's fast path. Permissions, timestamps and extended attributes
+    aren't copied: the Shokz's FAT filesystem can't keep most of them and
+    the player doesn't read them.
+    """
+    if not sys.platform.startswith("linux"):
+        shutil.copyfile(src, dst)
+        return
+
+    src_fd = os.open(src, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        expected = os.fstat(src_fd).st_size
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666)
+        try:
+            copied = _copy_fd_contents(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    # Never report a truncated file on the device as copied
+    if copied < expected:
+        raise OSError(errno.EIO, f"Short copy: {copied} of {expected} bytes written", str(dst))
+
+
+def _copy_fd_contents(src_fd: int, dst_fd: int) -> int:
+    """Copy from the current position of src_fd to dst_fd until end of file.
+
+    Tries copy_file_range, then sendfile, then a plain read/write loop,
+    moving on only if a call fails or returns 0 before any data was copied
+    (some filesystems report 0 rather than an error when unsupported).
+
+    Returns:
+        Number of bytes copied.
+    """
+    kernel_copies = []
+    if hasattr(os, "copy_file_range"):
+        kernel_copies.append(lambda: os.copy_file_range(src_fd, dst_fd, COPY_CHUNK_BYTES))
+    if hasattr(os, "sendfile"):
+        kernel_copies.append(lambda: os.sendfile(dst_fd, src_fd, None, COPY_CHUNK_BYTES))
+
+    for kernel_copy in kernel_copies:
+        copied = 0
+        try:
+            while True:
+                sent = kernel_copy()
+                if sent == 0:
+                    break
+                copied += sent
+        except OSError as e:
+            if copied or e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+        else:
+            if copied:
+                return copied
+
+    # Read into one reusable buffer instead of allocating a chunk per read
+    buffer = memoryview(bytearray(COPY_BUFFER_BYTES))
+    copied = 0
+    with open(src_fd, "rb", buffering=0, closefd=False) as fsrc:
+        while True:
+            length = fsrc.readinto(buffer)
+            if not length:
+                return copied
+            written = 0
+            while written < length:
+                written += os.write(dst_fd, buffer[written:length])
+            copied += length
+
+
+def _get_unique_filename(
+    original_name: str,
+    used_names: set[str],
+    counters: Optional[dict[str, int]] = None,
+    original_lower: Optional[str] = None,
+) -> str:
     """Generate a unique filename, adding number suffix if needed.
 
     Args:
         original_name: Original filename.
         used_names: Set of already used names (lowercase).
+        counters: Optional dict, shared across calls, of the next suffix
+            number to try for each lowercase original name. Without it a
+            run of N identical names costs O(N^2) lookups.
+        original_lower: original_name.lower(), if the caller already has it.
 
     Returns:
         Unique filename.
     """
-    if original_name.lower() not in used_names:
+    if original_lower is None:
+        original_lower = original_name.lower()
+    if original_lower not in used_names:
         return original_name
 
     # Split name and extension
@@ -238,13 +577,17 @@ def _get_unique_filename(original_name: str, used_names: set[str]) -> str:
     stem = path.stem
     suffix = path.suffix
 
-    # Try adding numbers until unique
-    counter = 1
-    while True:
-        new_name = f"{stem}_{counter}{suffix}"
-        if new_name.lower() not in used_names:
-            return new_name
+    # Lowercase the parts once instead of each candidate name
+    stem_lower = stem.lower()
+    suffix_lower = suffix.lower()
+
+    # Try adding numbers until unique, resuming after the last one handed out
+    counter = counters.get(original_lower, 1) if counters is not None else 1
+    while f"{stem_lower}_{counter}{suffix_lower}" in used_names:
         counter += 1
+    if counters is not None:
+        counters[original_lower] = counter + 1
+    return f"{stem}_{counter}{suffix}"
 
 
 def perform_full_transfer(
@@ -266,7 +609,7 @@ def perform_full_transfer(
     """
     target = config.target
 
-    # Check mount
+    # Check mount once; the clear and copy steps below skip their own checks
     if not is_shokz_mounted(target):
         return TransferResult(
             success=False,
@@ -279,9 +622,9 @@ def perform_full_transfer(
     if status_callback:
         status_callback("Clearing existing music files...")
 
-    deleted, clear_errors = clear_shokz_music(
+    deleted, clear_errors = _clear_shokz_music_unchecked(
         target,
-        config.music_extensions,
+        config.music_extensions_set,
         progress_callback,
     )
 
@@ -297,7 +640,9 @@ def perform_full_transfer(
     if status_callback:
         status_callback("Copying new files...")
 
-    result = transfer_to_shokz(tracks, target, progress_callback)
+    result = _transfer_to_shokz_unchecked(
+        tracks, target, progress_callback, workers=config.copy_workers
+    )
 
     return result
 
@@ -318,7 +663,7 @@ def archive_shokz_contents(
     if not is_shokz_mounted(config.target):
         return False, "Shokz device not mounted"
 
-    files = get_shokz_contents(config.target, config.music_extensions)
+    files = get_shokz_contents(config.target, config.music_extensions_set)
 
     if not files:
         return False, "No music files on Shokz to archive"
@@ -335,8 +680,9 @@ def archive_shokz_contents(
     filename = f"shokz_archive_{timestamp}.json"
     filepath = archive_dir / filename
 
-    # Build archive data
+    # Build archive data (files is our own copy, so sort it in place)
     total_bytes = sum(f.size_bytes for f in files)
+    files.sort(key=lambda x: x.name_folded)
     archive_data = {
         "archived_at": datetime.now().isoformat(),
         "file_count": len(files),
@@ -346,15 +692,15 @@ def archive_shokz_contents(
                 "filename": f.name,
                 "size_mb": round(f.size_mb, 2),
             }
-            for f in sorted(files, key=lambda x: x.name.lower())
+            for f in files
         ],
     }
 
-    # Write file
+    # Write file, encoded in one go rather than streamed in small pieces.
+    # Kept indented: archives are meant to be read by people.
     try:
         with open(filepath, "w") as f:
-            json.dump(archive_data, f, indent=2)
-            f.write("\n")
+            f.write(json.dumps(archive_data, indent=2) + "\n")
         return True, str(filepath)
     except OSError as e:
         return False, f"Failed to write archive: {e}"
@@ -1,5 +1,8 @@
 """Terminal UI helpers for tables, selection, and progress display."""
 
+import time
+from typing import Callable
+
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -9,6 +12,26 @@ from .indexer import Track
 # Shared console instance
 console = Console()
 
+# Minimum seconds between forwarded progress updates (about 30 per second)
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+
+# Column definitions shared by the track tables, keyed by header
+_TRACK_COLUMNS = {
+    "#": {"justify": "right", "style": "cyan", "width": 4},
+    "Title": {"style": "white", "max_width": 35, "overflow": "ellipsis"},
+    "Artist": {"style": "green", "max_width": 25, "overflow": "ellipsis"},
+    "Album": {"style": "blue", "max_width": 25, "overflow": "ellipsis"},
+    "Size": {"justify": "right", "style": "magenta", "width": 8},
+}
+
+
+def _make_tracks_table(title: str, headers: tuple[str, ...]) -> Table:
+    """Create an empty track table with the given columns from _TRACK_COLUMNS."""
+    table = Table(title=title)
+    for header in headers:
+        table.add_column(header, **_TRACK_COLUMNS[header])
+    return table
+
 
 def display_tracks(tracks: list[Track], title: str = "Results") -> None:
     """Display tracks as a numbered table.
@@ -21,12 +44,7 @@ def display_tracks(tracks: list[Track], title: str = "Results") -> None:
         console.print("[yellow]No tracks found.[/yellow]")
         return
 
-    table = Table(title=title)
-    table.add_column("#", justify="right", style="cyan", width=4)
-    table.add_column("Title", style="white", max_width=35, overflow="ellipsis")
-    table.add_column("Artist", style="green", max_width=25, overflow="ellipsis")
-    table.add_column("Album", style="blue", max_width=25, overflow="ellipsis")
-    table.add_column("Size", justify="right", style="magenta", width=8)
+    table = _make_tracks_table(title, ("#", "Title", "Artist", "Album", "Size"))
 
     for i, track in enumerate(tracks, start=1):
         table.add_row(
@@ -63,11 +81,7 @@ def display_playlist(tracks: list[Track], capacity_mb: int) -> None:
     else:
         color = "green"
 
-    table = Table(title="Current Playlist")
-    table.add_column("#", justify="right", style="cyan", width=4)
-    table.add_column("Title", style="white", max_width=35, overflow="ellipsis")
-    table.add_column("Artist", style="green", max_width=25, overflow="ellipsis")
-    table.add_column("Size", justify="right", style="magenta", width=8)
+    table = _make_tracks_table("Current Playlist", ("#", "Title", "Artist", "Size"))
 
     for i, track in enumerate(tracks, start=1):
         table.add_row(
@@ -126,8 +140,8 @@ def parse_selection(input_str: str, max_value: int) -> list[int]:
                 if start_num < 1 or end_num > max_value or start_num > end_num:
                     continue
 
-                for i in range(start_num, end_num + 1):
-                    indices.add(i - 1)  # Convert to 0-based
+                # Add the whole 0-based range in one C-level update
+                indices.update(range(start_num - 1, end_num))
             except ValueError:
                 continue
         else:
@@ -233,3 +247,27 @@ def create_progress() -> Progress:
         TaskProgressColumn(),
         console=console,
     )
+
+
+def throttle_progress(
+    callback: Callable[[str, int, int], None],
+    interval: float = PROGRESS_UPDATE_INTERVAL,
+) -> Callable[[str, int, int], None]:
+    """Wrap a progress callback(status, current, total) to limit its update rate.
+
+    Calls are dropped if one was forwarded less than interval seconds ago,
+    unless current equals total. That covers status-only updates (0 of 0)
+    and the final one, so phase labels show and the bar finishes in the
+    right state.
+    """
+    last_update = float("-inf")
+
+    def throttled(status: str, current: int, total: int) -> None:
+        nonlocal last_update
+        now = time.monotonic()
+        if current != total and now - last_update < interval:
+            return
+        last_update = now
+        callback(status, current, total)
+
+    return throttled
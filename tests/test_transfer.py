@@ -0,0 +1,127 @@
+"""Tests for copying tracks to the Shokz device."""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from shokz_transfer import transfer
+from shokz_transfer.indexer import Track
+
+
+class TransferInterruptTest(unittest.TestCase):
+    """An interrupted transfer must not leave empty or partial files behind."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.source = root / "library"
+        self.target = root / "shokz"
+        self.source.mkdir()
+        self.target.mkdir()
+
+        self.tracks = []
+        for i in range(12):
+            path = self.source / f"song{i:02d}.mp3"
+            path.write_bytes(bytes([i]) * (4096 + i))
+            self.tracks.append(
+                Track(path, f"Song {i}", "Artist", "Album", "Rock", path.stat().st_size, "mp3")
+            )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_interrupt_removes_unfinished_destinations(self) -> None:
+        real_copy = transfer._copy_file
+        release = threading.Event()
+
+        def slow_copy(src: Path, dst: Path) -> None:
+            # Hold the later copies until the interrupt has been raised
+            if src.name >= "song02":
+                release.wait(timeout=5)
+            real_copy(src, dst)
+
+        def interrupt(name: str, current: int, total: int) -> None:
+            if current == 2:
+                release.set()
+                raise KeyboardInterrupt
+
+        with mock.patch.object(transfer, "_copy_file", slow_copy):
+            with self.assertRaises(KeyboardInterrupt):
+                transfer.transfer_to_shokz(self.tracks, self.target, interrupt, workers=2)
+
+        remaining = sorted(p.name for p in self.target.iterdir())
+        self.assertTrue(remaining)
+        self.assertLess(len(remaining), len(self.tracks))
+        for name in remaining:
+            self.assertEqual(
+                (self.target / name).read_bytes(),
+                (self.source / name).read_bytes(),
+            )
+
+    def test_failed_copy_leaves_no_placeholder(self) -> None:
+        missing = Track(
+            self.source / "missing.mp3", "Missing", "Artist", "Album", "Rock", 1, "mp3"
+        )
+
+        result = transfer.transfer_to_shokz(
+            [self.tracks[0], missing, self.tracks[1]], self.target, workers=2
+        )
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.files_copied, 2)
+        self.assertEqual(
+            sorted(p.name for p in self.target.iterdir()),
+            ["song00.mp3", "song01.mp3"],
+        )
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "kernel copy paths are Linux-only")
+class CopyFallbackTest(unittest.TestCase):
+    """Kernel copies that report 0 bytes up front must fall back, not stop."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.target = root / "shokz"
+        self.target.mkdir()
+        self.source = root / "song.mp3"
+        self.source.write_bytes(os.urandom(5000))
+        self.track = Track(self.source, "Song", "Artist", "Album", "Rock", 5000, "mp3")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _transfer(self) -> transfer.TransferResult:
+        return transfer.transfer_to_shokz([self.track], self.target)
+
+    def test_copy_file_range_returning_zero_falls_back(self) -> None:
+        with mock.patch.object(os, "copy_file_range", return_value=0, create=True):
+            result = self._transfer()
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.files_copied, 1)
+        self.assertEqual((self.target / "song.mp3").read_bytes(), self.source.read_bytes())
+
+    def test_all_kernel_copies_returning_zero_use_read_write(self) -> None:
+        with mock.patch.object(os, "copy_file_range", return_value=0, create=True), \
+                mock.patch.object(os, "sendfile", return_value=0, create=True):
+            result = self._transfer()
+
+        self.assertTrue(result.success)
+        self.assertEqual((self.target / "song.mp3").read_bytes(), self.source.read_bytes())
+
+    def test_short_copy_is_reported_as_failure(self) -> None:
+        with mock.patch.object(transfer, "_copy_fd_contents", return_value=0):
+            result = self._transfer()
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.files_copied, 0)
+        self.assertFalse((self.target / "song.mp3").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()